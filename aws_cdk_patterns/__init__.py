@@ -1,3 +1,13 @@
-from aws_cdk_patterns.network.vpc import CustomVpcPattern
+__version__ = "0.1.0"
 
 __all__ = ["CustomVpcPattern"]
+
+
+def __getattr__(name):
+    # PEP 562 lazy re-export: importing aws_cdk_patterns alone should not pay
+    # for the aws_cdk/jsii bootstrap; the pattern modules load on first use.
+    if name == "CustomVpcPattern":
+        from aws_cdk_patterns.network.vpc import CustomVpcPattern
+
+        return CustomVpcPattern
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
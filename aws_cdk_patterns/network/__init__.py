@@ -1,3 +1,10 @@
-from aws_cdk_patterns.network.vpc import CustomVpcPattern
-
 __all__ = ["CustomVpcPattern"]
+
+
+def __getattr__(name):
+    # Defer the aws_cdk import until the pattern is actually used.
+    if name == "CustomVpcPattern":
+        from aws_cdk_patterns.network.vpc import CustomVpcPattern
+
+        return CustomVpcPattern
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
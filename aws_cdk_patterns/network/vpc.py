@@ -1,14 +1,139 @@
+from __future__ import annotations
+
+import functools
+import re
+from dataclasses import dataclass
+
 from constructs import Construct
-from aws_cdk import aws_ec2 as ec2
-from typing import Optional, List
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Optional, List, Tuple
+
+if TYPE_CHECKING:
+    from aws_cdk import Stack
+    from aws_cdk import aws_ec2 as ec2
+
+__all__ = ("CustomVpcPattern",)
+
+# Fast-path IPv4 CIDR syntax check; matching and octet/prefix range checks run
+# in C, avoiding an ipaddress.IPv4Network allocation per validation.
+_CIDR_RE = re.compile(r"^(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})/(\d{1,2})$")
+
+
+def _load_cdk() -> None:
+    """Bind the aws_cdk modules into module globals on first use.
+
+    Importing aws_cdk/aws_ec2 boots the jsii kernel and takes hundreds of
+    milliseconds; deferring it keeps `import aws_cdk_patterns.network.vpc`
+    cheap for callers that never construct a pattern.
+    """
+    global Stack, ec2
+    if "ec2" not in globals():
+        from aws_cdk import Stack, aws_ec2 as ec2
+
+
+@functools.cache
+def _interface_endpoints() -> Dict[str, Tuple[str, object]]:
+    """Get the Systems Manager interface endpoints, keyed by property name.
+
+    Resolving the service enum members here means the jsii attribute getters
+    fire once per process instead of once per pattern instance.
+
+    Returns:
+        Dict[str, Tuple[str, object]]: Mapping of accessor property name to (construct ID, endpoint service)
+    """
+    _load_cdk()
+    svc = ec2.InterfaceVpcEndpointAwsService
+    return {
+        "ssm_endpoint": ("SSMEndpoint", svc.SSM),
+        "ssm_messages_endpoint": ("SSMMessagesEndpoint", svc.SSM_MESSAGES),
+        "ec2_messages_endpoint": ("EC2MessagesEndpoint", svc.EC2_MESSAGES),
+        "ec2_endpoint": ("EC2Endpoint", svc.EC2),
+        "ssm_incidents_endpoint": ("SSMIncidents", svc.SSM_INCIDENTS),
+    }
+
+
+@functools.cache
+def _s3_service() -> "ec2.GatewayVpcEndpointAwsService":
+    """Get the S3 gateway endpoint service, resolved once per process.
+
+    Returns:
+        ec2.GatewayVpcEndpointAwsService: The S3 gateway service
+    """
+    _load_cdk()
+    return ec2.GatewayVpcEndpointAwsService.S3
+
+
+@functools.cache
+def _subnet_configurations(enable_internet: bool) -> Tuple["ec2.SubnetConfiguration", ...]:
+    """Get the canonical subnet layout for a VPC, built once per process.
+
+    SubnetConfiguration is an immutable value object, so every pattern
+    instance can share the same objects.
+
+    Args:
+        enable_internet (bool): Whether public subnets and NAT Gateways are enabled
+
+    Returns:
+        Tuple[ec2.SubnetConfiguration, ...]: The subnet configurations for the VPC
+    """
+    _load_cdk()
+    if enable_internet:
+        return (
+            ec2.SubnetConfiguration(
+                name="Public", subnet_type=ec2.SubnetType.PUBLIC, cidr_mask=24
+            ),
+            ec2.SubnetConfiguration(
+                name="Private",
+                subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS,
+                cidr_mask=24,
+            ),
+        )
+    return (
+        ec2.SubnetConfiguration(
+            name="Isolated", subnet_type=ec2.SubnetType.PRIVATE_ISOLATED, cidr_mask=24
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _cidr_addresses(cidr: str) -> "ec2.IIpAddresses":
+    """Get the IpAddresses object for a CIDR, cached per CIDR string.
+
+    Apps deploying many VPCs typically share a handful of CIDR ranges, so the
+    jsii factory call happens once per distinct range per process.
+
+    Args:
+        cidr (str): The CIDR range, e.g. "10.0.0.0/16"
+
+    Returns:
+        ec2.IIpAddresses: The IP address provider for the VPC
+    """
+    _load_cdk()
+    return ec2.IpAddresses.cidr(cidr)
+
+
+@dataclass(frozen=True, slots=True)
+class _VpcConfig:
+    """Resolved construction parameters for a CustomVpcPattern."""
+
+    cidr: str
+    max_azs: int
+    enable_internet: bool
+    nat_gateways: int
 
 
 class CustomVpcPattern(Construct):
-    """A custom VPC pattern that creates a VPC with configurable options and required Systems Manager endpoints.
+    """A custom VPC pattern that creates a VPC with configurable options and lazily-created Systems Manager endpoints.
 
     By default, creates a VPC with public subnets, private subnets with egress, and NAT Gateway.
     When enable_internet=False, creates only isolated private subnets with no internet access.
 
+    VPC endpoints are materialized lazily: accessing an endpoint property (e.g.
+    ssm_endpoint) creates the endpoint on first use and caches it. Pass
+    endpoints=ENDPOINT_NAMES (or a subset) to create a known set eagerly.
+
+    Use from_existing to wrap a VPC that is already deployed: the pattern then
+    imports the VPC by ID instead of creating one, emitting no VPC resources.
+
     Args:
         scope (Construct): The scope in which to define this construct.
         id (str): The scoped construct ID.
@@ -16,6 +141,8 @@ class CustomVpcPattern(Construct):
         max_azs (Optional[int]): Maximum number of Availability Zones to use. Defaults to 3.
         enable_internet (Optional[bool]): Whether to create public subnets and NAT Gateways. Defaults to True.
         nat_gateways (Optional[int]): Number of NAT Gateways to create if enable_internet is True. Defaults to 1.
+        endpoints (Optional[Iterable[str]]): Endpoint property names (see ENDPOINT_NAMES) to create eagerly. Defaults to None (create on first access only).
+        existing_vpc_id (Optional[str]): ID of a deployed VPC to import instead of creating one. Defaults to None.
 
     Properties:
         vpc (ec2.Vpc): The underlying VPC construct
@@ -23,8 +150,25 @@ class CustomVpcPattern(Construct):
         private_subnets (List[ec2.ISubnet]): List of private subnets in the VPC
         public_subnets (List[ec2.ISubnet]): List of public subnets in the VPC (empty if enable_internet is False)
         isolated_subnets (List[ec2.ISubnet]): List of isolated subnets in the VPC (only when enable_internet is False)
+        s3_gateway_endpoint (ec2.GatewayVpcEndpoint): The S3 gateway endpoint (created on first access)
+        ssm_endpoint (ec2.InterfaceVpcEndpoint): The SSM interface endpoint (created on first access)
+        ssm_messages_endpoint (ec2.InterfaceVpcEndpoint): The SSM Messages interface endpoint (created on first access)
+        ec2_messages_endpoint (ec2.InterfaceVpcEndpoint): The EC2 Messages interface endpoint (created on first access)
+        ec2_endpoint (ec2.InterfaceVpcEndpoint): The EC2 interface endpoint (created on first access)
+        ssm_incidents_endpoint (ec2.InterfaceVpcEndpoint): The SSM Incidents interface endpoint (created on first access)
     """
 
+    # Endpoint property names accepted by the endpoints keyword; must stay in
+    # sync with _interface_endpoints() plus the gateway accessor.
+    ENDPOINT_NAMES = (
+        "s3_gateway_endpoint",
+        "ssm_endpoint",
+        "ssm_messages_endpoint",
+        "ec2_messages_endpoint",
+        "ec2_endpoint",
+        "ssm_incidents_endpoint",
+    )
+
     def __init__(
         self,
         scope: Construct,
@@ -34,6 +178,8 @@ class CustomVpcPattern(Construct):
         max_azs: int = 3,
         enable_internet: bool = True,
         nat_gateways: int = 1,
+        endpoints: Optional[Iterable[str]] = None,
+        existing_vpc_id: Optional[str] = None,
     ) -> None:
         """Initialize a new CustomVpcPattern.
 
@@ -44,83 +190,209 @@ class CustomVpcPattern(Construct):
             max_azs (int, optional): Maximum number of Availability Zones to use. Defaults to 3
             enable_internet (bool, optional): Whether to create public subnets and NAT Gateways. Defaults to True
             nat_gateways (int, optional): Number of NAT Gateways to create if enable_internet is True. Defaults to 1
+            endpoints (Iterable[str], optional): Endpoint property names to create eagerly. Defaults to None
+            existing_vpc_id (str, optional): ID of a deployed VPC to import instead of creating one. Defaults to None
         """
         super().__init__(scope, id)
+        _load_cdk()
 
-        self.config = {
-            "cidr": cidr,
-            "max_azs": max_azs,
-            "enable_internet": enable_internet,
-            "nat_gateways": nat_gateways if enable_internet else 0,
-        }
-
-        subnet_configs = []
-
-        if self.config["enable_internet"]:
-            subnet_configs.extend(
-                [
-                    ec2.SubnetConfiguration(
-                        name="Public", subnet_type=ec2.SubnetType.PUBLIC, cidr_mask=24
-                    ),
-                    ec2.SubnetConfiguration(
-                        name="Private",
-                        subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS,
-                        cidr_mask=24,
-                    ),
-                ]
+        if existing_vpc_id is not None:
+            # Importing skips CIDR validation and the whole subnet/NAT
+            # subtree; from_lookup returns a lightweight proxy and emits no
+            # CloudFormation resources. config stays None since this pattern
+            # did not create the VPC.
+            self.config = None
+            self._imported_vpc_id = existing_vpc_id
+            self.vpc = ec2.Vpc.from_lookup(
+                self, "ImportedVpc", vpc_id=existing_vpc_id
             )
         else:
-            subnet_configs.append(
-                ec2.SubnetConfiguration(
-                    name="Isolated",
-                    subnet_type=ec2.SubnetType.PRIVATE_ISOLATED,
-                    cidr_mask=24,
-                )
+            if not self._is_valid_cidr(cidr):
+                raise ValueError(f"Invalid CIDR format: {cidr}")
+
+            effective_nat = nat_gateways if enable_internet else 0
+
+            self._imported_vpc_id = None
+            self.config = _VpcConfig(
+                cidr=cidr,
+                max_azs=max_azs,
+                enable_internet=enable_internet,
+                nat_gateways=effective_nat,
             )
 
-        self.vpc = ec2.Vpc(
-            self,
-            "CustomVpc",
-            ip_addresses=ec2.IpAddresses.cidr(self.config["cidr"]),
-            max_azs=self.config["max_azs"],
-            nat_gateways=self.config["nat_gateways"],
-            subnet_configuration=subnet_configs,
-        )
+            self.vpc = ec2.Vpc(
+                self,
+                "CustomVpc",
+                ip_addresses=_cidr_addresses(cidr),
+                max_azs=max_azs,
+                nat_gateways=effective_nat,
+                # jsii marshals this parameter as a list and rejects tuples,
+                # so the shared tuple is copied at the call boundary.
+                subnet_configuration=list(_subnet_configurations(enable_internet)),
+            )
 
-        # Add required VPC endpoints
-        self._add_vpc_endpoints()
+        # Endpoints are created lazily on first property access; touch only
+        # the ones the caller asked for up front.
+        if endpoints is not None:
+            for name in endpoints:
+                if name not in self.ENDPOINT_NAMES:
+                    raise ValueError(f"Unknown endpoint name: {name}")
+                getattr(self, name)
 
-    def _add_vpc_endpoints(self) -> None:
-        """Add required VPC endpoints for Systems Manager functionality."""
-        # Add S3 Gateway Endpoint
-        self.vpc.add_gateway_endpoint(
-            "S3Gateway", service=ec2.GatewayVpcEndpointAwsService.S3
-        )
+    @classmethod
+    def from_existing(
+        cls,
+        scope: Construct,
+        id: str,
+        *,
+        vpc_id: str,
+        add_endpoints: bool = False,
+    ) -> "CustomVpcPattern":
+        """Wrap an existing VPC instead of creating a new one.
 
-        # Add Systems Manager endpoints
-        self.vpc.add_interface_endpoint(
-            "SSMEndpoint", service=ec2.InterfaceVpcEndpointAwsService.SSM
-        )
+        The VPC is imported with ec2.Vpc.from_lookup, so no VPC, subnet or
+        NAT resources are synthesized. The enclosing stack must have a
+        concrete account and region for the lookup to resolve.
 
-        self.vpc.add_interface_endpoint(
-            "SSMMessagesEndpoint",
-            service=ec2.InterfaceVpcEndpointAwsService.SSM_MESSAGES,
+        Args:
+            scope (Construct): The scope in which to define this construct
+            id (str): The scoped construct ID
+            vpc_id (str): The ID of the deployed VPC to import
+            add_endpoints (bool, optional): Whether to eagerly create all Systems Manager endpoints in the imported VPC. Defaults to False
+
+        Returns:
+            CustomVpcPattern: A pattern backed by the imported VPC
+        """
+        return cls(
+            scope,
+            id,
+            existing_vpc_id=vpc_id,
+            endpoints=cls.ENDPOINT_NAMES if add_endpoints else None,
         )
 
-        self.vpc.add_interface_endpoint(
-            "EC2MessagesEndpoint",
-            service=ec2.InterfaceVpcEndpointAwsService.EC2_MESSAGES,
+    @staticmethod
+    def _is_valid_cidr(cidr: str) -> bool:
+        """Check whether a string is a syntactically valid IPv4 CIDR.
+
+        Args:
+            cidr (str): The CIDR string to validate, e.g. "10.0.0.0/16"
+
+        Returns:
+            bool: True if the string is a valid IPv4 CIDR
+        """
+        m = _CIDR_RE.match(cidr)
+        return (
+            m is not None
+            and all(int(octet) <= 255 for octet in m.group(1, 2, 3, 4))
+            and int(m.group(5)) <= 32
         )
 
-        self.vpc.add_interface_endpoint(
-            "EC2Endpoint", service=ec2.InterfaceVpcEndpointAwsService.EC2
+    def _shared_endpoint(self, name: str, create: Callable[[], object]) -> object:
+        """Create an endpoint, reusing one already made for the same imported VPC.
+
+        Patterns importing the same VPC by ID within one stack coalesce to a
+        single endpoint per service via a registry stored on the stack, keyed
+        by (vpc_id, endpoint name). Patterns that created their own VPC are
+        its sole owner, so no cross-pattern sharing is possible there and the
+        endpoint is created directly (cached_property already prevents
+        re-creation within one pattern).
+
+        Args:
+            name (str): The endpoint property name, used in the registry key
+            create (Callable): Zero-argument factory that creates the endpoint
+
+        Returns:
+            object: The shared or newly created endpoint
+        """
+        if self._imported_vpc_id is None:
+            return create()
+
+        stack = Stack.of(self)
+        cache = getattr(stack, "_shared_vpc_endpoints", None)
+        if cache is None:
+            cache = {}
+            stack._shared_vpc_endpoints = cache
+
+        key = (self._imported_vpc_id, name)
+        endpoint = cache.get(key)
+        if endpoint is None:
+            endpoint = create()
+            cache[key] = endpoint
+        return endpoint
+
+    def _interface_endpoint(self, name: str) -> ec2.InterfaceVpcEndpoint:
+        """Create the interface endpoint registered under the given property name.
+
+        Args:
+            name (str): A key of the _interface_endpoints() registry
+
+        Returns:
+            ec2.InterfaceVpcEndpoint: The interface endpoint, shared with other patterns importing the same VPC
+        """
+        endpoint_id, service = _interface_endpoints()[name]
+        return self._shared_endpoint(
+            name,
+            lambda: self.vpc.add_interface_endpoint(endpoint_id, service=service),
         )
 
-        self.vpc.add_interface_endpoint(
-            "SSMIncidents", service=ec2.InterfaceVpcEndpointAwsService.SSM_INCIDENTS
+    @functools.cached_property
+    def s3_gateway_endpoint(self) -> ec2.GatewayVpcEndpoint:
+        """Get the S3 gateway endpoint, creating it on first access.
+
+        Returns:
+            ec2.GatewayVpcEndpoint: The S3 gateway endpoint
+        """
+        return self._shared_endpoint(
+            "s3_gateway_endpoint",
+            lambda: self.vpc.add_gateway_endpoint("S3Gateway", service=_s3_service()),
         )
 
-    @property
+    @functools.cached_property
+    def ssm_endpoint(self) -> ec2.InterfaceVpcEndpoint:
+        """Get the SSM interface endpoint, creating it on first access.
+
+        Returns:
+            ec2.InterfaceVpcEndpoint: The SSM interface endpoint
+        """
+        return self._interface_endpoint("ssm_endpoint")
+
+    @functools.cached_property
+    def ssm_messages_endpoint(self) -> ec2.InterfaceVpcEndpoint:
+        """Get the SSM Messages interface endpoint, creating it on first access.
+
+        Returns:
+            ec2.InterfaceVpcEndpoint: The SSM Messages interface endpoint
+        """
+        return self._interface_endpoint("ssm_messages_endpoint")
+
+    @functools.cached_property
+    def ec2_messages_endpoint(self) -> ec2.InterfaceVpcEndpoint:
+        """Get the EC2 Messages interface endpoint, creating it on first access.
+
+        Returns:
+            ec2.InterfaceVpcEndpoint: The EC2 Messages interface endpoint
+        """
+        return self._interface_endpoint("ec2_messages_endpoint")
+
+    @functools.cached_property
+    def ec2_endpoint(self) -> ec2.InterfaceVpcEndpoint:
+        """Get the EC2 interface endpoint, creating it on first access.
+
+        Returns:
+            ec2.InterfaceVpcEndpoint: The EC2 interface endpoint
+        """
+        return self._interface_endpoint("ec2_endpoint")
+
+    @functools.cached_property
+    def ssm_incidents_endpoint(self) -> ec2.InterfaceVpcEndpoint:
+        """Get the SSM Incidents interface endpoint, creating it on first access.
+
+        Returns:
+            ec2.InterfaceVpcEndpoint: The SSM Incidents interface endpoint
+        """
+        return self._interface_endpoint("ssm_incidents_endpoint")
+
+    @functools.cached_property
     def vpc_id(self) -> str:
         """Get the VPC ID.
 
@@ -129,7 +401,7 @@ class CustomVpcPattern(Construct):
         """
         return self.vpc.vpc_id
 
-    @property
+    @functools.cached_property
     def private_subnets(self) -> List[ec2.ISubnet]:
         """Get the private subnets.
 
@@ -138,7 +410,7 @@ class CustomVpcPattern(Construct):
         """
         return self.vpc.private_subnets
 
-    @property
+    @functools.cached_property
     def public_subnets(self) -> List[ec2.ISubnet]:
         """Get the public subnets.
 
@@ -147,7 +419,7 @@ class CustomVpcPattern(Construct):
         """
         return self.vpc.public_subnets
 
-    @property
+    @functools.cached_property
     def isolated_subnets(self) -> List[ec2.ISubnet]:
         """Get the isolated subnets.
 
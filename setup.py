@@ -6,7 +6,12 @@ setup(
     description="Reusable AWS CDK Patterns",
     author="Greg Medard",
     author_email="medarg@amazon.com",
-    packages=find_packages(include=["aws_cdk_patterns", "aws_cdk_patterns.*"]),
+    packages=find_packages(
+        include=["aws_cdk_patterns", "aws_cdk_patterns.*"],
+        exclude=["tests*", "cdk.out*", "node_modules*"],
+    ),
+    package_data={"aws_cdk_patterns": ["py.typed"]},
+    include_package_data=True,
     install_requires=["aws-cdk-lib>=2.0.0", "constructs>=10.0.0,<11.0.0"],
     python_requires=">=3.12",
 )